@@ -7,6 +7,7 @@ https://github.com/DanrwAU/zenwifi
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING
@@ -15,7 +16,7 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
-from .api import ZenWifiApiClient
+from .api import MAX_CONCURRENT_REQUESTS, ZenWifiApiClient
 from .const import DOMAIN
 from .coordinator import ZenWifiDataUpdateCoordinator
 from .data import ZenWifiData
@@ -35,17 +36,25 @@ PLATFORMS: list[Platform] = [
 
 # The thermostat only pushes telemetry to the cloud about every 5 minutes
 # (statusRefreshPeriod=300), so polling faster just refetches identical data.
-# User-initiated changes call async_request_refresh() directly and update at once.
+# User-initiated changes call async_request_refresh(), which refreshes at once;
+# the coordinator's default debouncer folds repeats within 10 s into one poll.
 SCAN_INTERVAL = timedelta(minutes=2)
 
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(hass: HomeAssistant, entry: ZenWifiConfigEntry) -> bool:
     """Set up this integration using UI."""
+    # One semaphore for every entry, so several accounts polling at the same
+    # moment still keep the total load on the Zen cloud bounded.
+    api_semaphore = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "api_semaphore", asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    )
+
     client = ZenWifiApiClient(
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         session=async_get_clientsession(hass),
+        request_semaphore=api_semaphore,
     )
 
     coordinator = ZenWifiDataUpdateCoordinator(
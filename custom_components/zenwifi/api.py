@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
 import socket
+import time
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 import aiohttp
 import async_timeout
+import orjson
 
 TIMEOUT = 10
 API_HOST = "wifi.zenhq.com"
+# Cap on concurrent polling requests to the Zen cloud. Extra requests wait on
+# the semaphore before their TIMEOUT starts.
+MAX_CONCURRENT_REQUESTS = 4
+HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
+# Fallback lifetime when the token response omits expires_in.
+DEFAULT_TOKEN_LIFETIME = 3600
+# Refresh this many seconds before expiry so requests never race the deadline.
+TOKEN_REFRESH_MARGIN = 30
+
+_JSON_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+_FORM_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
+_MODE_ENDPOINT = {
+    "heat": "/api/v1/device/heat",
+    "off": "/api/v1/device/off",
+}
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,7 +57,10 @@ class ZenWifiApiClientAuthenticationError(ZenWifiApiClientError):
 
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
-    if response.status in (401, 403):
+    status = response.status
+    if status < HTTP_BAD_REQUEST:
+        return
+    if status in (401, 403):
         msg = "Invalid credentials"
         raise ZenWifiApiClientAuthenticationError(
             msg,
@@ -39,6 +68,22 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+def _consumer_id_from_token(token: str | None) -> str | None:
+    """Return the consumerId claim from a JWT access token, if it carries one."""
+    if not token:
+        return None
+    try:
+        _, payload, _ = token.split(".")
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except ValueError:
+        return None
+    if not isinstance(claims, dict):
+        return None
+    return claims.get("consumerId")
+
+
 class ZenWifiApiClient:
     """Zen WiFi Thermostat API Client."""
 
@@ -47,33 +92,37 @@ class ZenWifiApiClient:
         username: str,
         password: str,
         session: aiohttp.ClientSession,
+        request_semaphore: asyncio.Semaphore | None = None,
     ) -> None:
         """Initialize the API client."""
-        self._username = username
-        self._password = password
         self._session = session
         self._access_token: str | None = None
         self._refresh_token: str | None = None
+        self._token_expires_at = 0.0
+        # Serialises token renewal so concurrent requests refresh only once.
+        self._token_lock = asyncio.Lock()
         self._consumer_id: str | None = None
+        # May be shared between clients to bound load across several accounts.
+        self._request_semaphore = request_semaphore or asyncio.Semaphore(
+            MAX_CONCURRENT_REQUESTS
+        )
+        # Credentials never change for a client, so encode the login body once.
+        self._auth_body = (
+            f"grant_type=password&username={quote_plus(username)}"
+            f"&password={quote_plus(password)}"
+        )
 
     async def async_authenticate(self) -> dict[str, str]:
         """Authenticate with username and password."""
-        data = {
-            "grant_type": "password",
-            "username": self._username,
-            "password": self._password,
-        }
-
         response = await self._api_wrapper(
             method="post",
             endpoint="/api/token",
-            data=data,
+            data=self._auth_body,
             use_auth=False,
             content_type="application/x-www-form-urlencoded",
         )
 
-        self._access_token = response.get("access_token")
-        self._refresh_token = response.get("refresh_token")
+        self._store_tokens(response)
         return response
 
     async def async_refresh_tokens(self) -> dict[str, str]:
@@ -82,10 +131,9 @@ class ZenWifiApiClient:
             msg = "No refresh token available"
             raise ZenWifiApiClientAuthenticationError(msg)
 
-        data = {
-            "grant_type": "refresh_token",
-            "refresh_token": self._refresh_token,
-        }
+        data = (
+            f"grant_type=refresh_token&refresh_token={quote_plus(self._refresh_token)}"
+        )
 
         response = await self._api_wrapper(
             method="post",
@@ -95,9 +143,39 @@ class ZenWifiApiClient:
             content_type="application/x-www-form-urlencoded",
         )
 
+        self._store_tokens(response)
+        return response
+
+    def _store_tokens(self, response: dict[str, Any]) -> None:
+        """Store tokens from a token response and note when they expire."""
         self._access_token = response.get("access_token")
         self._refresh_token = response.get("refresh_token")
-        return response
+        # Consumer IDs are stable per account; taking it from the token saves
+        # the userinfo round trip when the claim is present.
+        if not self._consumer_id:
+            self._consumer_id = _consumer_id_from_token(self._access_token)
+        lifetime = float(response.get("expires_in") or DEFAULT_TOKEN_LIFETIME)
+        self._token_expires_at = time.monotonic() + lifetime - TOKEN_REFRESH_MARGIN
+
+    async def _async_ensure_token(self) -> None:
+        """Obtain a token, or refresh it ahead of expiry rather than on a 401."""
+        if self._access_token and time.monotonic() < self._token_expires_at:
+            return
+        async with self._token_lock:
+            # Another request may have renewed the token while we waited.
+            if not self._access_token:
+                await self.async_authenticate()
+            elif time.monotonic() >= self._token_expires_at:
+                if self._refresh_token:
+                    await self.async_refresh_tokens()
+                else:
+                    await self.async_authenticate()
+
+    async def _async_renew_rejected_token(self, rejected_token: str | None) -> None:
+        """Refresh a token the server rejected, unless another request already has."""
+        async with self._token_lock:
+            if self._access_token == rejected_token:
+                await self.async_refresh_tokens()
 
     async def async_get_user_info(self) -> dict[str, Any]:
         """Get user information including consumer ID."""
@@ -110,13 +188,14 @@ class ZenWifiApiClient:
 
     async def async_get_devices(self) -> list[dict[str, Any]]:
         """Get list of devices."""
-        if not self._consumer_id:
-            await self.async_get_user_info()
-
-        response = await self._api_wrapper(
-            method="get",
-            endpoint=f"/api/v1/consumer/device/getall?consumerId={self._consumer_id}",
-        )
+        async with self._request_semaphore:
+            if not self._consumer_id:
+                await self.async_get_user_info()
+
+            response = await self._api_wrapper(
+                method="get",
+                endpoint=f"/api/v1/consumer/device/getall?consumerId={self._consumer_id}",
+            )
         return response.get("devices", [])
 
     async def async_get_device_status(self, device_id: str) -> dict[str, Any]:
@@ -126,18 +205,38 @@ class ZenWifiApiClient:
             endpoint=f"/api/v1/device/status?deviceId={device_id}",
         )
 
+    async def async_get_device_statuses(
+        self, device_ids: list[str]
+    ) -> dict[str, dict[str, Any] | ZenWifiApiClientError]:
+        """
+        Get the status of several devices concurrently.
+
+        Results are keyed by device id; a failed fetch is returned as its
+        exception so one bad device does not sink the rest.
+        """
+        results: dict[str, dict[str, Any] | ZenWifiApiClientError] = {}
+
+        async def _fetch(device_id: str) -> None:
+            async with self._request_semaphore:
+                try:
+                    results[device_id] = await self.async_get_device_status(device_id)
+                except ZenWifiApiClientError as exception:
+                    results[device_id] = exception
+
+        async with asyncio.TaskGroup() as task_group:
+            for device_id in device_ids:
+                task_group.create_task(_fetch(device_id))
+        return results
+
     async def async_set_mode(
         self, device_id: str, mode: str, temperature: float | None = None
     ) -> Any:
         """Set thermostat mode and optionally temperature."""
-        endpoint_map = {
-            "heat": "/api/v1/device/heat",
-            "off": "/api/v1/device/off",
-        }
-
-        if mode not in endpoint_map:
+        try:
+            endpoint = _MODE_ENDPOINT[mode]
+        except KeyError:
             msg = f"Invalid mode: {mode}"
-            raise ValueError(msg)
+            raise ValueError(msg) from None
 
         data = {"deviceid": device_id}
         if mode != "off" and temperature is not None:
@@ -145,7 +244,7 @@ class ZenWifiApiClient:
 
         return await self._api_wrapper(
             method="post",
-            endpoint=endpoint_map[mode],
+            endpoint=endpoint,
             data=data,
         )
 
@@ -153,30 +252,32 @@ class ZenWifiApiClient:
         self,
         method: str,
         endpoint: str,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | str | None = None,
         *,
         use_auth: bool = True,
         content_type: str = "application/json",
     ) -> Any:
-        """Make API request with automatic token refresh on 401."""
+        """Make API request, refreshing the token before expiry or on 401."""
         url = f"https://{API_HOST}{endpoint}"
-        headers = {"Accept": "application/json"}
 
+        # Serialise the body ourselves; orjson is much faster than aiohttp's
+        # stdlib-based json= path, and the header templates set Content-Type.
+        request_data: str | bytes | None = None
+        if content_type == "application/x-www-form-urlencoded":
+            headers = _FORM_HEADERS.copy()
+            if data:
+                # Token requests pass a pre-encoded body.
+                request_data = data if isinstance(data, str) else urlencode(data)
+        else:
+            headers = _JSON_HEADERS.copy()
+            if data:
+                request_data = orjson.dumps(data)
+
+        sent_token = None
         if use_auth:
-            if not self._access_token:
-                await self.async_authenticate()
-            headers["Authorization"] = f"Bearer {self._access_token}"
-
-        if data:
-            headers["Content-Type"] = content_type
-
-        # Convert data based on content type
-        request_data = None
-        json_data = None
-        if content_type == "application/x-www-form-urlencoded" and data:
-            request_data = urlencode(data)
-        elif content_type == "application/json" and data:
-            json_data = data
+            await self._async_ensure_token()
+            sent_token = self._access_token
+            headers["Authorization"] = f"Bearer {sent_token}"
 
         try:
             async with async_timeout.timeout(TIMEOUT):
@@ -185,12 +286,11 @@ class ZenWifiApiClient:
                     url=url,
                     headers=headers,
                     data=request_data,
-                    json=json_data,
                 )
 
                 if response.status == HTTP_UNAUTHORIZED and use_auth:
                     # Try to refresh token
-                    await self.async_refresh_tokens()
+                    await self._async_renew_rejected_token(sent_token)
                     # Retry request with new token
                     headers["Authorization"] = f"Bearer {self._access_token}"
                     response = await self._session.request(
@@ -198,25 +298,25 @@ class ZenWifiApiClient:
                         url=url,
                         headers=headers,
                         data=request_data,
-                        json=json_data,
                     )
 
                 _verify_response_or_raise(response)
 
-                # Check if response has JSON content
-                content_type = response.headers.get("content-type", "")
-                if "application/json" in content_type:
-                    return await response.json()
-                # For non-JSON responses (like empty success responses)
-                text = await response.text()
-                _LOGGER.debug(
-                    "Non-JSON response from %s: content-type=%s, body=%s",
-                    endpoint,
-                    content_type,
-                    text[:200],  # Log first 200 chars
-                )
-                # Return empty dict for successful non-JSON responses
-                return {}
+                # Successful responses are JSON or empty, so skip sniffing the
+                # content-type header and just try to decode the body.
+                raw = await response.read()
+                if not raw:
+                    return {}
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    _LOGGER.debug(
+                        "Non-JSON response from %s: body=%s",
+                        endpoint,
+                        raw[:200],  # Log first 200 bytes
+                    )
+                    # Return empty dict for successful non-JSON responses
+                    return {}
 
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
@@ -11,7 +11,6 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import ZenWifiDataUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -44,20 +43,19 @@ async def async_setup_entry(
     """Set up the binary_sensor platform."""
     coordinator = entry.runtime_data.coordinator
 
-    entities = []
-    for device_id, device_data in coordinator.data.items():
-        entities.extend(
+    async_add_entities(
+        [
             ZenWifiBinarySensor(
                 coordinator=coordinator,
                 device_id=device_id,
                 device_data=device_data,
                 entity_description=description,
             )
+            for device_id, device_data in coordinator.data.items()
             for description in BINARY_SENSOR_DESCRIPTIONS
             if description.key in device_data
-        )
-
-    async_add_entities(entities)
+        ]
+    )
 
 
 class ZenWifiBinarySensor(
@@ -79,14 +77,7 @@ class ZenWifiBinarySensor(
         self.entity_description = entity_description
         self._device_id = device_id
         self._attr_unique_id = f"{device_id}_{entity_description.key}"
-
-        # Set device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device_data.get("name", "Zen WiFi Thermostat"),
-            "manufacturer": "Zen Ecosystems",
-            "model": "Zen Thermostat",
-        }
+        self._attr_device_info = coordinator.device_info_for(device_id)
 
     @property
     def device_data(self) -> dict[str, Any]:
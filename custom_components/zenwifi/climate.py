@@ -12,9 +12,9 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import ZenWifiDataUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -49,6 +49,24 @@ MODE_STATUS_LABELS = {
     MODE_OFF_REQUESTED: "Off Requested",
 }
 
+# HVAC mode for each Zen mode value, indexed by the value itself. Derived from
+# HEAT_MODES/OFF_MODES so the two can't disagree; building it raises KeyError at
+# import if a labelled mode is in neither group or the values stop being 0..n.
+_HVAC_FOR_MODE = dict.fromkeys(HEAT_MODES, HVACMode.HEAT) | dict.fromkeys(
+    OFF_MODES, HVACMode.OFF
+)
+MODE_TO_HVAC = tuple(_HVAC_FOR_MODE[mode] for mode in range(len(MODE_STATUS_LABELS)))
+
+
+def _hvac_action(data: dict[str, Any]) -> HVACAction:
+    """Derive the running hvac operation from a device's data."""
+    if not data.get("isOnline") or data.get("mode") in OFF_MODES:
+        return HVACAction.OFF
+    relay_states = data.get("relayStates") or {}
+    if relay_states.get("w1") or relay_states.get("w2"):
+        return HVACAction.HEATING
+    return HVACAction.IDLE
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -86,14 +104,11 @@ class ZenWifiClimate(CoordinatorEntity[ZenWifiDataUpdateCoordinator], ClimateEnt
         """Initialize the climate entity."""
         super().__init__(coordinator)
         self._device_id = device_id
+        self._client = coordinator.client
         self._attr_unique_id = f"{device_id}_climate"
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device_data.get("name", "Zen WiFi Thermostat"),
-            "manufacturer": "Zen Ecosystems",
-            "model": "Zen Thermostat",
-        }
+        self._attr_device_info = coordinator.device_info_for(device_id)
+        # Derived once per poll rather than on every state read.
+        self._attr_hvac_action = _hvac_action(device_data)
 
     @property
     def device_data(self) -> dict[str, Any]:
@@ -116,42 +131,41 @@ class ZenWifiClimate(CoordinatorEntity[ZenWifiDataUpdateCoordinator], ClimateEnt
     def hvac_mode(self) -> HVACMode:
         """Return current operation (heat or off)."""
         mode = self.device_data.get("mode")
-        if mode in HEAT_MODES:
-            return HVACMode.HEAT
-        if mode in OFF_MODES:
-            return HVACMode.OFF
+        if isinstance(mode, int) and 0 <= mode < len(MODE_TO_HVAC):
+            return MODE_TO_HVAC[mode]
         _LOGGER.debug("Unexpected Zen mode %s; defaulting to OFF", mode)
         return HVACMode.OFF
 
     @property
     def target_temperature(self) -> float | None:
         """Return the heat setpoint we try to reach."""
-        if self.hvac_mode == HVACMode.HEAT:
-            return self.device_data.get("heatingSetpoint")
+        data = self.device_data
+        if data.get("mode") in HEAT_MODES:
+            return data.get("heatingSetpoint")
         return None
 
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return the current running hvac operation."""
-        if not self.device_data.get("isOnline", False):
-            return HVACAction.OFF
-        if self.device_data.get("mode") in OFF_MODES:
-            return HVACAction.OFF
-        relay_states = self.device_data.get("relayStates", {})
-        if relay_states.get("w1") or relay_states.get("w2"):
-            return HVACAction.HEATING
-        return HVACAction.IDLE
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute derived state when the coordinator has new data."""
+        self._attr_hvac_action = _hvac_action(self.device_data)
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Expose the fine-grained Zen status as a state attribute."""
-        mode = self.device_data.get("mode")
+        data = self.device_data
+        mode = data.get("mode")
         return {
             "status": MODE_STATUS_LABELS.get(mode, f"Unknown ({mode})"),
             "zen_mode_raw": mode,
-            "pending": self.device_data.get("hasRequestedState", False),
+            "pending": data.get("hasRequestedState", False),
         }
 
+    async def _async_refresh_device(self) -> None:
+        """Drop the cached status and refresh so a command's effect shows."""
+        self.coordinator.invalidate_status(self._device_id)
+        await self.coordinator.async_request_refresh()
+
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature (heat only)."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
@@ -160,28 +174,30 @@ class ZenWifiClimate(CoordinatorEntity[ZenWifiDataUpdateCoordinator], ClimateEnt
         if self.hvac_mode != HVACMode.HEAT:
             # Setpoint only applies while heating.
             return
-        await self.coordinator.client.async_set_mode(
-            self._device_id, "heat", temperature
-        )
-        await self.coordinator.async_request_refresh()
+        await self._client.async_set_mode(self._device_id, "heat", temperature)
+        await self._async_refresh_device()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode (heat or off)."""
         if hvac_mode == HVACMode.HEAT:
-            await self.coordinator.client.async_set_mode(
+            await self._client.async_set_mode(
                 self._device_id, "heat", self.device_data.get("heatingSetpoint")
             )
         elif hvac_mode == HVACMode.OFF:
-            await self.coordinator.client.async_set_mode(self._device_id, "off")
+            await self._client.async_set_mode(self._device_id, "off")
         else:
             msg = f"Unsupported HVAC mode: {hvac_mode}"
             raise ValueError(msg)
-        await self.coordinator.async_request_refresh()
+        await self._async_refresh_device()
 
     async def async_turn_on(self) -> None:
         """Turn the entity on (heat)."""
-        await self.async_set_hvac_mode(HVACMode.HEAT)
+        await self._client.async_set_mode(
+            self._device_id, "heat", self.device_data.get("heatingSetpoint")
+        )
+        await self._async_refresh_device()
 
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
-        await self.async_set_hvac_mode(HVACMode.OFF)
+        await self._client.async_set_mode(self._device_id, "off")
+        await self._async_refresh_device()
@@ -9,7 +9,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
     ZenWifiApiClient,
@@ -141,7 +141,7 @@ class ZenWifiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         client = ZenWifiApiClient(
             username=username,
             password=password,
-            session=async_create_clientsession(self.hass),
+            session=async_get_clientsession(self.hass),
         )
         # Test authentication and get user info
         await client.async_authenticate()
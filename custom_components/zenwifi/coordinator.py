@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -14,11 +15,13 @@ from .api import (
     ZenWifiApiClientCommunicationError,
     ZenWifiApiClientError,
 )
+from .const import DOMAIN
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
 
     from .data import ZenWifiConfigEntry
 
@@ -27,6 +30,19 @@ _LOGGER = logging.getLogger(__name__)
 # Devices that were never provisioned report this placeholder date.
 UNPROVISIONED_DATE_PREFIX = "0001-01-01"
 
+# Statuses younger than this are reused. Scheduled polls are 2 minutes apart and
+# never hit the cache; it serves refreshes that follow closely on another one:
+# the debouncer's trailing refresh after a burst of commands (which then only
+# refetches the commanded device, see invalidate_status) and manual
+# update_entity calls. A reload builds a new coordinator with an empty cache.
+STATUS_CACHE_TTL = 15.0
+
+
+def _is_provisioned(device: dict[str, Any]) -> bool:
+    """Return whether a device was provisioned (not the placeholder date)."""
+    provisioned = device.get("provisionedDateTime")
+    return bool(provisioned) and not provisioned.startswith(UNPROVISIONED_DATE_PREFIX)
+
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class ZenWifiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -50,37 +66,76 @@ class ZenWifiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=update_interval,
         )
         self.client = client
+        self._status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._device_info_cache: dict[str, DeviceInfo] = {}
+
+    def device_info_for(self, device_id: str) -> DeviceInfo:
+        """Return the device info shared by all entities of a device."""
+        name = self.data.get(device_id, {}).get("name", "Zen WiFi Thermostat")
+        device_info = self._device_info_cache.get(device_id)
+        if device_info is None or device_info["name"] != name:
+            device_info = self._device_info_cache[device_id] = {
+                "identifiers": {(DOMAIN, device_id)},
+                "name": name,
+                "manufacturer": "Zen Ecosystems",
+                "model": "Zen Thermostat",
+            }
+        return device_info
+
+    def invalidate_status(self, device_id: str) -> None:
+        """
+        Drop a device's cached status so the next refresh refetches it.
+
+        Commands call this before requesting a refresh. Otherwise a refresh
+        within STATUS_CACHE_TTL of the previous one would serve the
+        pre-command status and hide the command's effect.
+        """
+        self._status_cache.pop(device_id, None)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch provisioned devices and merge in their current status."""
         try:
             devices = await self.client.async_get_devices()
 
-            # Skip devices that were never provisioned (placeholder date).
             valid_devices = [
                 device
                 for device in devices
-                if device.get("provisionedDateTime")
-                and not device["provisionedDateTime"].startswith(
-                    UNPROVISIONED_DATE_PREFIX
-                )
+                if device.get("id") and _is_provisioned(device)
             ]
-
-            device_data: dict[str, Any] = {}
+            # Forget devices that are gone so the caches stay bounded.
+            valid_ids = {device["id"] for device in valid_devices}
+            for device_id in self._status_cache.keys() - valid_ids:
+                del self._status_cache[device_id]
+            for device_id in self._device_info_cache.keys() - valid_ids:
+                del self._device_info_cache[device_id]
+
+            now = time.monotonic()
+            stale_ids: list[str] = []
             for device in valid_devices:
-                device_id = device.get("id")
-                if not device_id:
-                    continue
-                try:
-                    status = await self.client.async_get_device_status(device_id)
-                    device_data[device_id] = {**device, **status}
-                except ZenWifiApiClientCommunicationError:
+                cached = self._status_cache.get(device["id"])
+                if cached is None or now - cached[0] >= STATUS_CACHE_TTL:
+                    stale_ids.append(device["id"])
+            # Status calls are independent, so fetch them concurrently.
+            statuses = await self.client.async_get_device_statuses(stale_ids)
+
+            for device_id, status in statuses.items():
+                if isinstance(status, ZenWifiApiClientCommunicationError):
                     # Transient per-device failure: keep the basic list info.
                     _LOGGER.warning(
-                        "Status fetch failed for device %s; using basic info",
+                        "Status fetch failed for device %s; using basic info: %s",
                         device_id,
+                        status,
                     )
-                    device_data[device_id] = device
+                    self._status_cache.pop(device_id, None)
+                elif isinstance(status, ZenWifiApiClientError):
+                    raise status
+                else:
+                    self._status_cache[device_id] = (now, status)
+
+            device_data: dict[str, Any] = {}
+            for device in valid_devices:
+                cached = self._status_cache.get(device["id"])
+                device_data[device["id"]] = device | cached[1] if cached else device
         except ZenWifiApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except ZenWifiApiClientError as exception:
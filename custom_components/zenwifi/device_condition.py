@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
-from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
 from homeassistant.components.device_automation import DEVICE_CONDITION_BASE_SCHEMA
 from homeassistant.components.homeassistant import condition
 from homeassistant.const import (
@@ -18,23 +17,34 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN
+from .helpers import async_get_climate_entries
 
 if TYPE_CHECKING:
     from homeassistant.helpers.typing import ConfigType
 
-CONDITION_TYPES = {
-    "is_off",
-    "is_heating",
+# Climate state each state condition checks for.
+CONDITION_STATES = {
+    "is_off": "off",
+    "is_heating": "heat",
 }
 
-TEMPERATURE_CONDITION_TYPES = {
-    "current_temperature_above",
-    "current_temperature_below",
+# Threshold option each temperature condition compares against.
+TEMPERATURE_CONDITION_THRESHOLDS = {
+    "current_temperature_above": CONF_ABOVE,
+    "current_temperature_below": CONF_BELOW,
 }
 
+CONDITION_TYPES = set(CONDITION_STATES)
+TEMPERATURE_CONDITION_TYPES = set(TEMPERATURE_CONDITION_THRESHOLDS)
+
+# Every climate entity gets the same conditions; only the ids are filled in.
+_CONDITION_TEMPLATES = tuple(
+    {CONF_DOMAIN: DOMAIN, CONF_TYPE: condition_type}
+    for condition_type in CONDITION_TYPES | TEMPERATURE_CONDITION_TYPES
+)
+
 # Single schema HA validates every stored condition against; it must accept both
 # the state conditions and the temperature ones (with their above/below value).
 CONDITION_SCHEMA = DEVICE_CONDITION_BASE_SCHEMA.extend(
@@ -51,28 +61,12 @@ async def async_get_conditions(
     hass: HomeAssistant, device_id: str
 ) -> list[dict[str, Any]]:
     """List device conditions for Zen WiFi Thermostat devices."""
-    registry = er.async_get(hass)
-    conditions: list[dict[str, Any]] = []
-
-    climate_entries = [
-        entry
-        for entry in er.async_entries_for_device(registry, device_id)
-        if entry.domain == CLIMATE_DOMAIN
+    return [
+        {**template, CONF_DEVICE_ID: device_id, CONF_ENTITY_ID: entry.entity_id}
+        for entry in async_get_climate_entries(hass, device_id)
+        for template in _CONDITION_TEMPLATES
     ]
 
-    for entry in climate_entries:
-        conditions.extend(
-            {
-                CONF_DEVICE_ID: device_id,
-                CONF_DOMAIN: DOMAIN,
-                CONF_ENTITY_ID: entry.entity_id,
-                CONF_TYPE: condition_type,
-            }
-            for condition_type in CONDITION_TYPES | TEMPERATURE_CONDITION_TYPES
-        )
-
-    return conditions
-
 
 @callback
 def async_condition_from_config(
@@ -82,8 +76,7 @@ def async_condition_from_config(
     condition_type = config[CONF_TYPE]
     entity_id = config[CONF_ENTITY_ID]
 
-    if condition_type in CONDITION_TYPES:
-        state = "off" if condition_type == "is_off" else "heat"
+    if (state := CONDITION_STATES.get(condition_type)) is not None:
         return condition.state(
             {
                 "entity_id": entity_id,
@@ -91,19 +84,11 @@ def async_condition_from_config(
             }
         )
 
-    if condition_type in TEMPERATURE_CONDITION_TYPES:
-        if condition_type == "current_temperature_above":
-            return condition.numeric_state(
-                {
-                    "entity_id": entity_id,
-                    "above": config[CONF_ABOVE],
-                    "attribute": "current_temperature",
-                }
-            )
+    if (threshold := TEMPERATURE_CONDITION_THRESHOLDS.get(condition_type)) is not None:
         return condition.numeric_state(
             {
                 "entity_id": entity_id,
-                "below": config[CONF_BELOW],
+                threshold: config[threshold],
                 "attribute": "current_temperature",
             }
         )
@@ -117,13 +102,11 @@ async def async_get_condition_capabilities(
     """List condition capabilities."""
     condition_type = config[CONF_TYPE]
 
-    if condition_type in TEMPERATURE_CONDITION_TYPES:
+    if (threshold := TEMPERATURE_CONDITION_THRESHOLDS.get(condition_type)) is not None:
         return {
             "extra_fields": vol.Schema(
                 {
-                    vol.Required(
-                        CONF_ABOVE if "above" in condition_type else CONF_BELOW
-                    ): vol.Coerce(float),
+                    vol.Required(threshold): vol.Coerce(float),
                 }
             )
         }
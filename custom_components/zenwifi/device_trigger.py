@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
-from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
 from homeassistant.components.homeassistant.triggers import (
     numeric_state as numeric_state_trigger,
@@ -23,26 +22,37 @@ from homeassistant.const import (
     CONF_TYPE,
 )
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN
+from .helpers import async_get_climate_entries
 
 if TYPE_CHECKING:
     from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
     from homeassistant.helpers.typing import ConfigType
 
-TRIGGER_TYPES = {
-    "turned_off",
-    "turned_on",
-    "changed_to_heat",
+# State change each state trigger listens for.
+STATE_TRIGGERS = {
+    "turned_off": {"to": "off"},
+    "turned_on": {"from": "off"},
+    "changed_to_heat": {"to": "heat"},
 }
 
-TEMPERATURE_TRIGGER_TYPES = {
-    "current_temperature_above",
-    "current_temperature_below",
+# Threshold option each temperature trigger compares against.
+TEMPERATURE_TRIGGER_THRESHOLDS = {
+    "current_temperature_above": CONF_ABOVE,
+    "current_temperature_below": CONF_BELOW,
 }
 
+TRIGGER_TYPES = set(STATE_TRIGGERS)
+TEMPERATURE_TRIGGER_TYPES = set(TEMPERATURE_TRIGGER_THRESHOLDS)
+
+# Every climate entity gets the same triggers; only the ids are filled in.
+_TRIGGER_TEMPLATES = tuple(
+    {CONF_DOMAIN: DOMAIN, CONF_TYPE: trigger_type}
+    for trigger_type in TRIGGER_TYPES | TEMPERATURE_TRIGGER_TYPES
+)
+
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -58,28 +68,12 @@ async def async_get_triggers(
     hass: HomeAssistant, device_id: str
 ) -> list[dict[str, Any]]:
     """List device triggers for Zen WiFi Thermostat devices."""
-    registry = er.async_get(hass)
-    triggers: list[dict[str, Any]] = []
-
-    climate_entries = [
-        entry
-        for entry in er.async_entries_for_device(registry, device_id)
-        if entry.domain == CLIMATE_DOMAIN
+    return [
+        {**template, CONF_DEVICE_ID: device_id, CONF_ENTITY_ID: entry.entity_id}
+        for entry in async_get_climate_entries(hass, device_id)
+        for template in _TRIGGER_TEMPLATES
     ]
 
-    for entry in climate_entries:
-        triggers.extend(
-            {
-                CONF_DEVICE_ID: device_id,
-                CONF_DOMAIN: DOMAIN,
-                CONF_ENTITY_ID: entry.entity_id,
-                CONF_TYPE: trigger_type,
-            }
-            for trigger_type in TRIGGER_TYPES | TEMPERATURE_TRIGGER_TYPES
-        )
-
-    return triggers
-
 
 async def async_attach_trigger(
     hass: HomeAssistant,
@@ -91,37 +85,20 @@ async def async_attach_trigger(
     trigger_type = config[CONF_TYPE]
     entity_id = config[CONF_ENTITY_ID]
 
-    if trigger_type == "turned_off":
+    if (state_change := STATE_TRIGGERS.get(trigger_type)) is not None:
+        trigger_platform = state_trigger
         state_config = {
             "platform": "state",
             "entity_id": entity_id,
-            "to": "off",
+            **state_change,
         }
-    elif trigger_type == "turned_on":
-        state_config = {
-            "platform": "state",
-            "entity_id": entity_id,
-            "from": "off",
-        }
-    elif trigger_type == "changed_to_heat":
-        state_config = {
-            "platform": "state",
-            "entity_id": entity_id,
-            "to": "heat",
-        }
-    elif trigger_type == "current_temperature_above":
-        state_config = {
-            "platform": "numeric_state",
-            "entity_id": entity_id,
-            "attribute": "current_temperature",
-            "above": config[CONF_ABOVE],
-        }
-    elif trigger_type == "current_temperature_below":
+    elif (threshold := TEMPERATURE_TRIGGER_THRESHOLDS.get(trigger_type)) is not None:
+        trigger_platform = numeric_state_trigger
         state_config = {
             "platform": "numeric_state",
             "entity_id": entity_id,
             "attribute": "current_temperature",
-            "below": config[CONF_BELOW],
+            threshold: config[threshold],
         }
     else:
         return lambda: None
@@ -129,16 +106,10 @@ async def async_attach_trigger(
     if CONF_FOR in config:
         state_config[CONF_FOR] = config[CONF_FOR]
 
-    if trigger_type in TEMPERATURE_TRIGGER_TYPES:
-        state_config = await numeric_state_trigger.async_validate_trigger_config(
-            hass, state_config
-        )
-        return await numeric_state_trigger.async_attach_trigger(
-            hass, state_config, action, trigger_info, platform_type="device"
-        )
-
-    state_config = await state_trigger.async_validate_trigger_config(hass, state_config)
-    return await state_trigger.async_attach_trigger(
+    state_config = await trigger_platform.async_validate_trigger_config(
+        hass, state_config
+    )
+    return await trigger_platform.async_attach_trigger(
         hass, state_config, action, trigger_info, platform_type="device"
     )
 
@@ -149,13 +120,11 @@ async def async_get_trigger_capabilities(
     """List trigger capabilities."""
     trigger_type = config[CONF_TYPE]
 
-    if trigger_type in TEMPERATURE_TRIGGER_TYPES:
+    if (threshold := TEMPERATURE_TRIGGER_THRESHOLDS.get(trigger_type)) is not None:
         return {
             "extra_fields": vol.Schema(
                 {
-                    vol.Required(
-                        CONF_ABOVE if "above" in trigger_type else CONF_BELOW
-                    ): vol.Coerce(float),
+                    vol.Required(threshold): vol.Coerce(float),
                     vol.Optional(CONF_FOR): cv.positive_time_period_dict,
                 }
             )
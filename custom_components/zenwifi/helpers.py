@@ -0,0 +1,24 @@
+"""Helpers shared by the Zen WiFi Thermostat device automations."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@callback
+def async_get_climate_entries(
+    hass: HomeAssistant, device_id: str
+) -> list[er.RegistryEntry]:
+    """Return the climate entities registered for a device."""
+    return [
+        entry
+        for entry in er.async_entries_for_device(er.async_get(hass), device_id)
+        if entry.domain == CLIMATE_DOMAIN
+    ]
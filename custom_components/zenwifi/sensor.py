@@ -11,9 +11,9 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import ZenWifiDataUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -41,6 +41,10 @@ SENSOR_DESCRIPTIONS = [
     ),
 ]
 
+_DESCRIPTIONS_BY_KEY = {
+    description.key: description for description in SENSOR_DESCRIPTIONS
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,20 +54,18 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = entry.runtime_data.coordinator
 
-    entities = []
-    for device_id, device_data in coordinator.data.items():
-        entities.extend(
+    async_add_entities(
+        [
             ZenWifiSensor(
                 coordinator=coordinator,
                 device_id=device_id,
                 device_data=device_data,
-                entity_description=description,
+                entity_description=_DESCRIPTIONS_BY_KEY[key],
             )
-            for description in SENSOR_DESCRIPTIONS
-            if description.key in device_data
-        )
-
-    async_add_entities(entities)
+            for device_id, device_data in coordinator.data.items()
+            for key in device_data.keys() & _DESCRIPTIONS_BY_KEY.keys()
+        ]
+    )
 
 
 class ZenWifiSensor(CoordinatorEntity[ZenWifiDataUpdateCoordinator], SensorEntity):
@@ -82,28 +84,29 @@ class ZenWifiSensor(CoordinatorEntity[ZenWifiDataUpdateCoordinator], SensorEntit
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._device_id = device_id
+        self._device_data = device_data
         self._attr_unique_id = f"{device_id}_{entity_description.key}"
+        self._attr_device_info = coordinator.device_info_for(device_id)
 
-        # Set device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device_data.get("name", "Zen WiFi Thermostat"),
-            "manufacturer": "Zen Ecosystems",
-            "model": "Zen Thermostat",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up this device's data once per coordinator update."""
+        self._device_data = self.coordinator.data.get(self._device_id) or {}
+        super()._handle_coordinator_update()
 
     @property
     def device_data(self) -> dict[str, Any]:
         """Get current device data from coordinator."""
-        return self.coordinator.data.get(self._device_id, {})
+        return self._device_data
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        data = self._device_data
         return (
             self.coordinator.last_update_success
-            and self.device_data.get("isOnline", False)
-            and self.entity_description.key in self.device_data
+            and data.get("isOnline", False)
+            and self.entity_description.key in data
         )
 
     @property